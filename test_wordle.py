@@ -0,0 +1,80 @@
+import os
+import random
+
+import pytest
+
+import wordle
+
+STATUSES = ["absent", "present", "correct"]
+
+
+def pattern(guess, answer):
+    """Reference Wordle pattern: one status per tile, duplicates handled left to right."""
+    statuses = ["absent"] * wordle.WORD_LENGTH
+    unmatched = []
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            statuses[i] = "correct"
+        else:
+            unmatched.append(a)
+    for i, g in enumerate(guess):
+        if statuses[i] == "absent" and g in unmatched:
+            statuses[i] = "present"
+            unmatched.remove(g)
+    return statuses
+
+
+def feedback(guess, answer):
+    return [
+        {"pos": i, "letter": letter, "status": status}
+        for i, (letter, status) in enumerate(zip(guess, pattern(guess, answer)))
+    ]
+
+
+@pytest.fixture(autouse=True)
+def repo_dir(monkeypatch):
+    # The word lists are read relative to the working directory
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def filter_path(request, monkeypatch):
+    """Run each test once per filter_words implementation."""
+    if request.param == "numba":
+        if wordle._match_words_jit is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(wordle, "_match_words_jit", None)
+    return request.param
+
+
+def assert_matches_brute_force(answer, guesses):
+    word_filter = wordle.WordleFilter()
+    for n, guess in enumerate(guesses, start=1):
+        word_filter.add_feedback(feedback(guess, answer))
+        expected = [
+            w for w in word_filter.words
+            if all(pattern(g, w) == pattern(g, answer) for g in guesses[:n])
+        ]
+        assert word_filter.filter_words() == expected, (answer, guesses[:n])
+
+
+def test_filter_matches_brute_force(filter_path):
+    words = wordle.WordleFilter().words
+    rng = random.Random(7)
+    for trial in range(20):
+        answer = rng.choice(words)
+        # Alternate between the precomputed starting word and arbitrary openers
+        opener = [wordle.STARTING_WORD] if trial % 2 else []
+        assert_matches_brute_force(answer, opener + rng.sample(words, 2))
+
+
+@pytest.mark.parametrize("answer, guesses", [
+    # Two green e's and a yellow one: at least three e's, none at position 2
+    ("eerie", ["geese"]),
+    # One green and one gray copy of the same letter caps it at one
+    ("lever", ["level"]),
+    ("level", ["lever", "eerie"]),
+])
+def test_filter_handles_repeated_letters(filter_path, answer, guesses):
+    assert_matches_brute_force(answer, guesses)
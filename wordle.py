@@ -1,16 +1,30 @@
-from playwright.sync_api import sync_playwright
-import csv
-import time
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+import os
 import sys
 from typing import List, Dict, Set, Tuple
 import random
 
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # filter_words falls back to NumPy masks
+    njit = None
+
 # Constants
 WORD_LENGTH = 5
 MAX_ATTEMPTS = 6
 STARTING_WORD = "slant"
+PATTERN_TRITS = {"absent": 0, "present": 1, "correct": 2}
+PATTERN_COUNT = 3 ** WORD_LENGTH
+ENTROPY_CHUNK_CELLS = 2_000_000  # Max guess x answer pairs scored at once
+ENTROPY_MAX_GUESSES = 1500  # Candidates scored as guesses on large turns
+ENTROPY_MAX_ANSWERS = 500  # Sampled answers scored against on large turns
 WORD_FILE = "word_frequency.csv"
 PAST_ANSWERS_FILE = "past_answers.csv"
+STATE_FILE = "state.json"  # Browser storage state reused across runs
+HEADED = os.environ.get("WORDLE_HEADED") == "1"  # Show the browser for debugging
 TIMEOUTS = {
     "page_load": 5000,
     "feedback": 15000,
@@ -18,92 +32,310 @@ TIMEOUTS = {
     "initial_setup": 2000  # Initial wait after game setup
 }
 
+# CSS selector for a board row, shared by every row lookup (Python and JS)
+ROW_SELECTOR = 'div[aria-label="Row {row}"]'
+
+# Candidate selectors for a row's tiles, probed once per game
+TILE_SELECTORS = [
+    '[style*="animation-delay"] > div',
+    'div[data-testid*="tile"]',
+    '[aria-label]'
+]
+
+# Returns the number of tiles each candidate selector finds in a row
+TILE_COUNTS_JS = """([rowSel, selectors]) => selectors.map(
+    sel => document.querySelectorAll(`${rowSel} ${sel}`).length
+)"""
+
+# Truthy once all five tiles of a row carry an evaluated status
+ROW_DONE_JS = """([rowSel, sel]) => {
+    const tiles = document.querySelectorAll(`${rowSel} ${sel}`);
+    if (tiles.length < 5) return false;
+    return Array.from(tiles).slice(0, 5).every(
+        t => /absent|present|correct/.test(t.getAttribute('aria-label') || '')
+    );
+}"""
+
+# Truthy once a row exists and all of its tiles are still empty
+ROW_READY_JS = """([rowSel, row]) => {
+    const r = document.querySelector(rowSel);
+    if (r) {
+        const tiles = Array.from(r.querySelectorAll('div[data-testid*="tile"]'));
+        if (tiles.length >= 5 && tiles.slice(0, 5).every(t => {
+            const label = t.getAttribute('aria-label') || '';
+            const state = (t.getAttribute('data-state') || '').toLowerCase();
+            return !label || state.includes('empty') || label.trim().split(/\\s+/).length <= 2;
+        })) return true;
+    }
+    // For the first row, the game area being present is enough
+    return row === 1 && document.querySelector('[data-testid="wordle-app-game"]') !== null;
+}"""
+
+def _letter_mask(letters) -> int:
+    """Pack letters into a 26-bit mask (bit k set iff chr(ord('a') + k) is included)."""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << (ord(letter) - ord("a"))
+    return mask
+
+def _match_words(words_bytes, bitmasks, correct, banned, absent_mask, required_mask):
+    """Return a bool mask of the words consistent with the given constraints.
+    
+    correct[pos] is the letter byte required at pos (0 if unknown) and banned
+    holds (pos, letter byte) rows for letters that must not sit at pos.
+    """
+    n, length = words_bytes.shape
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        ok = (bitmasks[i] & absent_mask) == 0 and (bitmasks[i] & required_mask) == required_mask
+        if ok:
+            for pos in range(length):
+                if correct[pos] != 0 and words_bytes[i, pos] != correct[pos]:
+                    ok = False
+                    break
+        if ok:
+            for k in range(banned.shape[0]):
+                if words_bytes[i, banned[k, 0]] == banned[k, 1]:
+                    ok = False
+                    break
+        out[i] = ok
+    return out
+
+_match_words_jit = njit(cache=True)(_match_words) if njit is not None else None
+
+def _feedback_patterns(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """Return the (G, A) base-3 Wordle pattern codes of each guess against each answer.
+    
+    Duplicate letters follow the game's rules: a misplaced letter is only
+    yellow while the answer still has unmatched copies of it, left to right.
+    """
+    green = guesses[:, None, :] == answers[None, :, :]
+    codes = np.zeros(green.shape[:2], dtype=np.uint8)
+    for i in range(WORD_LENGTH):
+        letter = guesses[:, i, None]
+        # Copies of the letter in the answer not already claimed by a green
+        available = ((answers[None, :, :] == letter[:, :, None]) & ~green).sum(axis=2)
+        # Earlier non-green copies in the guess that took one of those copies first
+        earlier = (guesses[:, None, :i] == letter[:, :, None]) & ~green[:, :, :i]
+        yellow = ~green[:, :, i] & (available > earlier.sum(axis=2))
+        codes += (2 * green[:, :, i] + yellow).astype(np.uint8) * np.uint8(3 ** i)
+    return codes
+
 class WordleFilter:
     """Handles word filtering logic based on Wordle feedback."""
     
     def __init__(self):
-        self.word_list = self._load_words()
+        self._load_words()
+        
+        # Constraint state, updated incrementally as feedback arrives
+        self.correct_pos: Dict[int, str] = {}
+        # (pos, letter) pairs ruled out: yellows, and gray copies of letters found elsewhere
+        self.banned_positions: Set[Tuple[int, str]] = set()
+        self.absent_mask: int = 0
+        self.required_mask: int = 0
+        self.min_counts = np.zeros(26, dtype=np.uint8)
+        self.max_counts = np.full(26, WORD_LENGTH, dtype=np.uint8)
+        self.rows_seen: int = 0
+        
+        # Indices of words still in play; shrinks every time filter_words runs
+        self.cand_idx = np.arange(len(self.words))
+        self._precompute_starting_patterns()
     
-    def _load_words(self) -> List[Dict[str, str]]:
-        """Load and cache word list once."""
-        with open(PAST_ANSWERS_FILE, newline="") as w:
-            past_words = {row["word"].lower() for row in csv.DictReader(w)}
-        with open(WORD_FILE, newline='') as f:
-            return [
-                row for row in csv.DictReader(f)
-                if len(row["word"]) == WORD_LENGTH and row["word"] not in past_words
-            ]
+    def _load_words(self):
+        """Load word list once into parallel NumPy arrays."""
+        # keep_default_na=False stops words like "null" being read as NaN
+        past = pd.read_csv(PAST_ANSWERS_FILE, dtype=str, keep_default_na=False)
+        past_words = set(past["word"].str.lower())
+        
+        df = pd.read_csv(WORD_FILE, dtype={"word": str}, keep_default_na=False)
+        df["word"] = df["word"].str.lower()
+        df = df[(df["word"].str.len() == WORD_LENGTH) & ~df["word"].isin(past_words)]
+        
+        self.words = df["word"].tolist()
+        assert len(set(self.words)) == len(self.words), "word list contains duplicates"
+        self.freq = dict(zip(self.words, df["frequency"].astype(float)))
+        
+        # (N, 5) letter bytes and a 26-bit "word contains letter" mask per word
+        n = len(self.words)
+        self.words_bytes = np.frombuffer(
+            "".join(self.words).encode("ascii"), dtype=np.uint8
+        ).reshape(n, WORD_LENGTH)
+        self.bitmasks = np.bitwise_or.reduce(
+            np.uint32(1) << (self.words_bytes - ord("a")).astype(np.uint32), axis=1
+        )
+        # (N, 26) per-letter counts for duplicate-letter constraints
+        self.counts = (
+            self.words_bytes[:, :, None] == np.arange(ord("a"), ord("z") + 1, dtype=np.uint8)
+        ).sum(axis=1, dtype=np.uint8)
+    
+    def _precompute_starting_patterns(self):
+        """Bucket every word by the feedback pattern STARTING_WORD would get against it."""
+        guess = np.frombuffer(STARTING_WORD.encode("ascii"), dtype=np.uint8)
+        # Per tile: 2 = correct, 1 = present, 0 = absent (exact for a guess with no repeated letters)
+        in_word = (self.bitmasks[:, None] >> (guess - ord("a")).astype(np.uint32)) & 1
+        trits = np.where(self.words_bytes == guess, 2, in_word)
+        codes = trits @ (3 ** np.arange(WORD_LENGTH))
+        self.start_index: Dict[int, np.ndarray] = {
+            int(code): np.flatnonzero(codes == code) for code in np.unique(codes)
+        }
     
-    def filter_words(self, feedback: List[Dict]) -> List[str]:
+    def add_feedback(self, row_feedback: List[Dict]):
+        """Fold one row of feedback into the cached constraint state."""
+        guess = "".join(f["letter"] for f in sorted(row_feedback, key=lambda f: f["pos"]))
+        if self.rows_seen == 0 and guess == STARTING_WORD and len(set(guess)) == WORD_LENGTH:
+            # Jump straight to the precomputed bucket for the opening guess
+            code = sum(PATTERN_TRITS[f["status"]] * 3 ** f["pos"] for f in row_feedback)
+            self.cand_idx = self.start_index.get(code, np.empty(0, dtype=np.intp))
+        self.rows_seen += 1
+        
+        # Green + yellow copies of each letter in this row are a lower bound on its count
+        row_counts = np.zeros(26, dtype=np.uint8)
+        for f in row_feedback:
+            if f["status"] in ("correct", "present"):
+                row_counts[ord(f["letter"]) - ord("a")] += 1
+        
+        for f in row_feedback:
+            if f["status"] == "correct":
+                self.correct_pos[f["pos"]] = f["letter"]
+                self.required_mask |= _letter_mask(f["letter"])
+            elif f["status"] == "present":
+                self.banned_positions.add((f["pos"], f["letter"]))
+                self.required_mask |= _letter_mask(f["letter"])
+            elif f["status"] == "absent":
+                k = ord(f["letter"]) - ord("a")
+                # A gray copy caps the letter at the copies found in this row
+                self.max_counts[k] = min(self.max_counts[k], row_counts[k])
+                if row_counts[k]:
+                    # ...and still rules the letter out of this position
+                    self.banned_positions.add((f["pos"], f["letter"]))
+                else:
+                    self.absent_mask |= _letter_mask(f["letter"])
+        np.maximum(self.min_counts, row_counts, out=self.min_counts)
+    
+    def filter_words(self) -> List[str]:
         """Filter words based on accumulated feedback."""
-        if not feedback:
-            return [row["word"].lower() for row in self.word_list]
+        present_mask = self.required_mask
+        absent_mask = self.absent_mask
         
-        # Pre-process feedback for efficiency
-        correct_pos = {f["pos"]: f["letter"] for f in feedback if f["status"] == "correct"}
-        present_pairs = [(f["pos"], f["letter"]) for f in feedback if f["status"] == "present"]
-        known_letters = {f["letter"] for f in feedback if f["status"] in ["correct", "present"]}
-        absent_letters = {f["letter"] for f in feedback 
-                         if f["status"] == "absent" and f["letter"] not in known_letters}
+        words_bytes = self.words_bytes[self.cand_idx]
+        bitmasks = self.bitmasks[self.cand_idx]
         
-        filtered = []
-        for row in self.word_list:
-            word = row["word"].lower()
+        if _match_words_jit is not None:
+            correct = np.zeros(WORD_LENGTH, dtype=np.uint8)
+            for pos, letter in self.correct_pos.items():
+                correct[pos] = ord(letter)
+            banned = np.array(
+                [(pos, ord(letter)) for pos, letter in self.banned_positions], dtype=np.uint8
+            ).reshape(-1, 2)
+            mask = _match_words_jit(
+                words_bytes, bitmasks, correct, banned,
+                np.uint32(absent_mask), np.uint32(present_mask)
+            )
+        else:
+            # Check letter membership: all known letters present, no absent letters
+            mask = ((bitmasks & absent_mask) == 0) & ((bitmasks & present_mask) == present_mask)
             
             # Check correct positions
-            if any(word[pos] != letter for pos, letter in correct_pos.items()):
-                continue
+            for pos, letter in self.correct_pos.items():
+                mask &= words_bytes[:, pos] == ord(letter)
             
-            # Check present letters (must be in word but not in guessed position)
-            if not all(letter in word and word[pos] != letter 
-                      for pos, letter in present_pairs):
-                continue
-            
-            # Check absent letters
-            if any(letter in word for letter in absent_letters):
-                continue
-            
-            filtered.append(word)
+            # Check banned letters are not in their guessed position
+            for pos, letter in self.banned_positions:
+                mask &= words_bytes[:, pos] != ord(letter)
+        
+        # Check duplicate-letter counts against the known bounds
+        counts = self.counts[self.cand_idx]
+        mask &= ((counts >= self.min_counts) & (counts <= self.max_counts)).all(axis=1)
         
-        return list(set(filtered))
+        self.cand_idx = self.cand_idx[mask]
+        return [self.words[i] for i in self.cand_idx]
     
     def get_best_guess(self, candidates: List[str]) -> str:
-        """Get highest frequency word from candidates."""
+        """Get the candidate whose feedback splits the remaining candidates most evenly.
+        
+        Scores each candidate by the entropy of its feedback-pattern buckets
+        over the candidates; ties go to the highest frequency word. Large
+        candidate sets score only the most frequent guesses against a fixed
+        random sample of answers so a turn stays well under a second.
+        """
         if not candidates:
             return ""
         
-        word_freq = {row["word"].lower(): float(row["frequency"]) 
-                    for row in self.word_list 
-                    if row["word"].lower() in candidates}
+        # Most frequent first, so capping the guesses keeps the likeliest words
+        guesses = sorted(candidates, key=lambda w: self.freq.get(w, 0.0), reverse=True)
+        guesses = guesses[:ENTROPY_MAX_GUESSES]
+        guesses_bytes = np.frombuffer(
+            "".join(guesses).encode("ascii"), dtype=np.uint8
+        ).reshape(-1, WORD_LENGTH)
+        answers_bytes = np.frombuffer(
+            "".join(candidates).encode("ascii"), dtype=np.uint8
+        ).reshape(-1, WORD_LENGTH)
+        if len(answers_bytes) > ENTROPY_MAX_ANSWERS:
+            rng = np.random.default_rng(0)
+            answers_bytes = answers_bytes[
+                rng.choice(len(answers_bytes), ENTROPY_MAX_ANSWERS, replace=False)
+            ]
+        
+        n, a = len(guesses), len(answers_bytes)
+        scores = np.empty(n)
+        
+        # Score guesses in chunks to keep the (G, A, 5) intermediates bounded
+        chunk = max(1, ENTROPY_CHUNK_CELLS // a)
+        for start in range(0, n, chunk):
+            codes = _feedback_patterns(guesses_bytes[start:start + chunk], answers_bytes)
+            g = codes.shape[0]
+            rows = np.repeat(np.arange(g), a) * PATTERN_COUNT
+            buckets = np.bincount(rows + codes.ravel(), minlength=g * PATTERN_COUNT)
+            buckets = buckets.reshape(g, PATTERN_COUNT).astype(float)
+            # Lower sum(b * log b) means smaller expected bucket, i.e. higher entropy
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores[start:start + g] = -np.nansum(buckets * np.log(buckets), axis=1)
         
-        return max(word_freq, key=word_freq.get) if word_freq else candidates[0]
+        best = np.flatnonzero(np.isclose(scores, scores.max()))
+        return max((guesses[i] for i in best), key=lambda w: self.freq.get(w, 0.0))
 
 class WordlePage:
     """Handles Wordle page interactions."""
     
     def __init__(self, page):
         self.page = page
+        self._tile_selector = TILE_SELECTORS[-1]
     
     def setup_game(self):
         """Initialize the game page."""
         self.page.goto("https://www.nytimes.com/games/wordle/index.html")
         
-        # Click play button with retry
-        self._click_play_button()
-        self._close_modal()
+        # Click play button with retry; a restored storage state skips both dialogs
+        if self._click_play_button():
+            self._close_modal()
         
         # Wait for game to be fully loaded and ready
         print("Waiting for game to initialize...")
         self.page.wait_for_timeout(TIMEOUTS["initial_setup"])
+        self._detect_tile_selector()
     
-    def _click_play_button(self):
-        """Click the play button with fallback."""
+    def _detect_tile_selector(self):
+        """Probe the first row once and cache the tile selector that matches."""
+        counts = self.page.evaluate(TILE_COUNTS_JS, [ROW_SELECTOR.format(row=1), TILE_SELECTORS])
+        for selector, count in zip(TILE_SELECTORS, counts):
+            if count >= WORD_LENGTH:
+                self._tile_selector = selector
+                break
+        print(f"Using tile selector: {self._tile_selector}")
+    
+    def _click_play_button(self) -> bool:
+        """Click the play button with fallback; return False if there is none."""
+        try:
+            self.page.get_by_test_id("Play").wait_for(state="visible", timeout=TIMEOUTS["page_load"])
+        except PlaywrightTimeoutError:
+            return False  # Splash already dismissed via restored storage state
         try:
             self.page.get_by_test_id("Play").click(timeout=TIMEOUTS["page_load"])
         except:
             print("Retrying play button click...")
             self.page.wait_for_timeout(1000)
             self.page.get_by_test_id("Play").click(timeout=TIMEOUTS["page_load"])
+        return True
     
     def _close_modal(self):
         """Close any modal dialogs."""
@@ -121,207 +353,112 @@ class WordlePage:
         # Wait for the row to be ready for input
         self._wait_for_row_ready(row)
         
-        # Type the word (no delays between keystrokes)
-        word = word.upper()
-        print(f"Typing word: {word}")
-        
-        for letter in word:
-            self.page.keyboard.press(f"Key{letter}")
-        
-        # Press Enter immediately
-        print("Pressing Enter...")
+        # Type the word in one call and submit immediately
+        print(f"Typing word: {word.upper()}")
+        self.page.keyboard.type(word)
         self.page.keyboard.press("Enter")
         
         # Wait for and extract feedback
         return self._get_row_feedback(row)
     
     def _wait_for_row_ready(self, row: int):
-        """Dynamically wait for the specified row to be ready for input."""
+        """Wait until the specified row is ready for input."""
         print(f"Checking if row {row} is ready for input...")
-        start_time = time.time()
-        
-        while time.time() - start_time < TIMEOUTS["row_ready_check"] / 1000:
-            try:
-                # Check if the row exists and is ready
-                row_locator = self.page.locator(f'//div[@aria-label="Row {row}"]')
-                row_locator.wait_for(timeout=1000)
-                
-                # Check if row is empty (ready for input)
-                tiles = row_locator.locator('div[data-testid*="tile"]')
-                tile_count = tiles.count()
-                
-                if tile_count >= WORD_LENGTH:
-                    # Check if tiles are empty (not filled)
-                    empty_tiles = 0
-                    for i in range(min(tile_count, WORD_LENGTH)):
-                        tile = tiles.nth(i)
-                        aria_label = tile.get_attribute("aria-label") or ""
-                        data_state = tile.get_attribute("data-state") or ""
-                        
-                        # Tile is empty if it doesn't have letters or is in 'empty' state
-                        if not aria_label or "empty" in data_state.lower() or len(aria_label.split()) <= 2:
-                            empty_tiles += 1
-                    
-                    if empty_tiles >= WORD_LENGTH:
-                        print(f"Row {row} is ready for input")
-                        return True
-                    else:
-                        print(f"Row {row} appears to have content, waiting...")
-                
-                # If row 1 and we can't find proper tiles, try alternative detection
-                if row == 1:
-                    # For first row, just check if we can focus on the game area
-                    game_area = self.page.locator('[data-testid="wordle-app-game"]')
-                    if game_area.count() > 0:
-                        print(f"Game area found, row {row} should be ready")
-                        return True
-                
-            except Exception as e:
-                print(f"Row readiness check attempt failed: {e}")
-            
-            time.sleep(0.5)  # Wait before next check
+        try:
+            self.page.wait_for_function(
+                ROW_READY_JS, arg=[ROW_SELECTOR.format(row=row), row],
+                timeout=TIMEOUTS["row_ready_check"]
+            )
+        except PlaywrightTimeoutError:
+            print(f"Warning: Row {row} readiness timeout, proceeding anyway")
+            return False
         
-        print(f"Warning: Row {row} readiness timeout, proceeding anyway")
-        return False
+        print(f"Row {row} is ready for input")
+        return True
+    
+    def _read_row_labels(self, row: int) -> List[str]:
+        """Read the aria-labels of a row's tiles in a single round-trip."""
+        row_locator = self.page.locator(ROW_SELECTOR.format(row=row))
+        return row_locator.locator(self._tile_selector).evaluate_all(
+            "els => els.slice(0, 5).map(e => e.getAttribute('aria-label'))"
+        )
     
     def _get_row_feedback(self, row: int) -> List[Dict]:
         """Wait for and extract feedback from a row."""
-        self._wait_for_animation(row)
-        
-        row_locator = self.page.locator(f'//div[@aria-label="Row {row}"]')
-        results = []
-        
-        # Try multiple approaches to get tile feedback
-        for i in range(WORD_LENGTH):
-            tile_selectors = [
-                f'[style*="animation-delay: {i * 100}ms"] > div',
-                f'div[data-testid*="tile"]:nth-child({i + 1})',
-                f'div:nth-child({i + 1})'
-            ]
-            
-            for selector in tile_selectors:
-                try:
-                    tile = row_locator.locator(selector)
-                    if tile.count() > 0:
-                        aria_label = tile.evaluate("el => el.getAttribute('aria-label')")
-                        
-                        if aria_label:
-                            parts = aria_label.split(", ")
-                            if len(parts) >= 3:
-                                results.append({
-                                    "pos": i,
-                                    "letter": parts[1].lower(),
-                                    "status": parts[2].lower()
-                                })
-                                break  # Found valid feedback for this position
-                except:
-                    continue
-        
+        results = self._wait_for_animation(row)
         print(f"Row {row} feedback: {[(r['letter'], r['status']) for r in results]}")
         return results
 
+    @staticmethod
+    def _parse_labels(labels: List[str]) -> List[Dict]:
+        """Parse tile aria-labels like '1st letter, S, correct' into feedback."""
+        results = []
+        for i, aria_label in enumerate(labels[:WORD_LENGTH]):
+            parts = (aria_label or "").split(", ")
+            if len(parts) >= 3:
+                results.append({
+                    "pos": i,
+                    "letter": parts[1].lower(),
+                    "status": parts[2].lower()
+                })
+        return results
     
-    def _wait_for_animation(self, row: int, timeout: int = 15):
-        """Wait for row animation to complete."""
+    def _wait_for_animation(self, row: int) -> List[Dict]:
+        """Wait for row animation to complete and return the parsed feedback."""
         print(f"Waiting for row {row} animation and feedback...")
-        start_time = time.time()
-        row_locator = self.page.locator(f'//div[@aria-label="Row {row}"]')
+        try:
+            self.page.wait_for_function(
+                ROW_DONE_JS, arg=[ROW_SELECTOR.format(row=row), self._tile_selector],
+                timeout=TIMEOUTS["feedback"]
+            )
+        except PlaywrightTimeoutError:
+            raise TimeoutError(f"Timeout waiting for row {row} feedback")
         
-        while time.time() - start_time < timeout:
-            tiles_ready = 0
-            all_correct = True
+        # One snapshot of the row drives both the feedback and the solved check
+        results = self._parse_labels(self._read_row_labels(row))
+        if len(results) == WORD_LENGTH and all(r["status"] == "correct" for r in results):
+            correct_word = "".join(r["letter"] for r in results).upper()
             
-            for i in range(WORD_LENGTH):
-                try:
-                    # Try multiple ways to find the tile
-                    tile_selectors = [
-                        f'[style*="animation-delay: {i * 100}ms"] > div',
-                        f'div[data-testid*="tile"]:nth-child({i + 1})',
-                        f'div:nth-child({i + 1})'
-                    ]
-                    
-                    tile = None
-                    label = ""
-                    
-                    for selector in tile_selectors:
-                        try:
-                            tile = row_locator.locator(selector)
-                            if tile.count() > 0:
-                                label = tile.get_attribute("aria-label") or ""
-                                if label:
-                                    break
-                        except:
-                            continue
-                    
-                    if label and any(status in label for status in ["absent", "present", "correct"]):
-                        tiles_ready += 1
-                        if "correct" not in label:
-                            all_correct = False
-                    
-                except Exception as e:
-                    continue
-            
-            if tiles_ready == WORD_LENGTH:
-                if all_correct:
-                    # Extract the correct word from the tiles
-                    correct_word = ""
-                    for i in range(WORD_LENGTH):
-                        try:
-                            for selector in [f'[style*="animation-delay: {i * 100}ms"] > div',
-                                           f'div[data-testid*="tile"]:nth-child({i + 1})',
-                                           f'div:nth-child({i + 1})']:
-                                try:
-                                    tile = row_locator.locator(selector)
-                                    if tile.count() > 0:
-                                        label = tile.get_attribute("aria-label") or ""
-                                        if label:
-                                            parts = label.split(", ")
-                                            if len(parts) >= 2:
-                                                correct_word += parts[1].upper()
-                                                break
-                                except:
-                                    continue
-                        except:
-                            continue
-                    
-                    print(f"🎉 PUZZLE SOLVED! The word was: {correct_word}")
-                    print(f"✅ Solved in {row} attempt{'s' if row > 1 else ''}!")
-                    self.page.wait_for_timeout(3000)  # Wait to see the celebration
-                    sys.exit(0)
-                print(f"Row {row} feedback complete ({tiles_ready} tiles ready)")
-                return
-            
-            time.sleep(0.3)
+            print(f"🎉 PUZZLE SOLVED! The word was: {correct_word}")
+            print(f"✅ Solved in {row} attempt{'s' if row > 1 else ''}!")
+            if HEADED:
+                self.page.wait_for_timeout(3000)  # Wait to see the celebration
+            sys.exit(0)
         
-        raise TimeoutError(f"Timeout waiting for row {row} feedback (only {tiles_ready} tiles ready)")
+        print(f"Row {row} feedback complete")
+        return results
 
 def main():
     """Main game loop."""
     word_filter = WordleFilter()
-    all_feedback = []
     
     with sync_playwright() as p:
-        browser = p.firefox.launch(headless=False)
-        page = browser.new_page()
+        browser = p.firefox.launch(headless=not HEADED)
+        # Reuse cookies/localStorage from earlier runs so NYT dialogs stay dismissed
+        context = browser.new_context(
+            storage_state=STATE_FILE if os.path.exists(STATE_FILE) else None
+        )
+        page = context.new_page()
         wordle_page = WordlePage(page)
         
         print("🎯 Starting Wordle solver...")
         wordle_page.setup_game()
+        context.storage_state(path=STATE_FILE)
         
         # First guess is always the starting word
-        start = input("Choose starting word (Leave empty for slant or 'random' for random word): ")
-        if start == "" or None:
+        start = input("Choose starting word (Leave empty for slant or 'random' for random word): ").strip().lower()
+        if not start:
             start = STARTING_WORD
         elif start == "random":
-            start = random.choice(word_filter._load_words())["word"]
+            start = random.choice(word_filter.words)
         
         print(f"Making first guess: {start}")
         feedback = wordle_page.make_guess(start, 1)
-        all_feedback.extend(feedback)
+        word_filter.add_feedback(feedback)
         
         # Subsequent guesses based on filtering
         for row in range(2, MAX_ATTEMPTS + 1):
-            candidates = word_filter.filter_words(all_feedback)
+            candidates = word_filter.filter_words()
             
             if not candidates:
                 print(f"❌ No valid words remaining at row {row}")
@@ -331,13 +468,16 @@ def main():
             print(f"Row {row}: {len(candidates)} candidates, guessing '{best_word}'")
             
             feedback = wordle_page.make_guess(best_word, row)
-            all_feedback.extend(feedback)
+            word_filter.add_feedback(feedback)
             
             # Debug output
             print(f"Feedback: {[(f['letter'], f['status']) for f in feedback]}")
         
-        print("🏁 Game completed. Waiting before closing...")
-        page.wait_for_timeout(10000)
+        if HEADED:
+            print("🏁 Game completed. Waiting before closing...")
+            page.wait_for_timeout(10000)
+        else:
+            print("🏁 Game completed.")
         browser.close()
 
 if __name__ == "__main__":